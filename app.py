@@ -1,9 +1,15 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+from pyarrow import csv as pacsv
 import plotly.express as px
 import plotly.graph_objects as go
+import io
 from datetime import datetime
-import pycountry
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Page Configuration
 st.set_page_config(
@@ -15,18 +21,6 @@ st.set_page_config(
 # Custom CSS
 st.markdown("""
 <style>
-    .card {
-        background-color: #000000;
-        border-radius: 10px;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        padding: 15px;
-        margin-bottom: 20px;
-    }
-    .metric-value {
-        font-size: 1.5rem;
-        font-weight: bold;
-        color: #2c3e50;
-    }
     .section-header {
         font-size: 1.3rem;
         font-weight: 600;
@@ -37,19 +31,223 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Convert country names to ISO codes
+# pycountry is imported inside these helpers so its database is only loaded
+# once the world map is actually requested
+COUNTRY_ALIASES = {
+    'USA': 'USA',
+    'US': 'USA',
+    'UK': 'GBR',
+}
+
+@st.cache_resource
+def get_name_to_iso():
+    import pycountry
+    name_to_iso = {c.name: c.alpha_3 for c in pycountry.countries}
+    name_to_iso.update({
+        c.official_name: c.alpha_3
+        for c in pycountry.countries if hasattr(c, 'official_name')
+    })
+    name_to_iso.update(COUNTRY_ALIASES)
+    return name_to_iso
+
+def _fuzzy_fallback(country_name):
+    import pycountry
+    try:
+        return pycountry.countries.search_fuzzy(country_name)[0].alpha_3
+    except LookupError:
+        return None
+
+def country_to_iso(country_name):
+    return get_name_to_iso().get(country_name) or _fuzzy_fallback(country_name)
+
+@st.cache_data
+def get_iso_map(country_names):
+    return {name: country_to_iso(name) for name in country_names}
+
 # Data Loading
+MONTH_ABBR = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+month_order = ['January', 'February', 'March', 'April', 'May', 'June', 
+               'July', 'August', 'September', 'October', 'November', 'December']
+
 @st.cache_data
 def load_data():
-    df = pd.read_csv('Chocolate Sales.csv')
-    df['Amount'] = df['Amount'].str.replace('[$,]', '', regex=True).astype(float)
-    df['Date'] = pd.to_datetime(df['Date'], format='%d-%b-%y', errors='coerce')
+    # Threaded Arrow reader with a fixed schema, so there is no inference pass
+    table = pacsv.read_csv(
+        'Chocolate Sales.csv',
+        convert_options=pacsv.ConvertOptions(column_types={
+            'Sales Person': pa.string(),
+            'Country': pa.string(),
+            'Product': pa.string(),
+            'Date': pa.string(),
+            'Amount': pa.string(),
+            'Boxes Shipped': pa.int32()
+        })
+    )
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    # Amounts look like "$5,320 "; Arrow's float cast rejects the trailing space
+    df['Amount'] = df['Amount'].str.translate(str.maketrans('', '', '$, ')).astype('float32')
+    # Dates look like 04-Jan-22; assemble them from integer parts instead of
+    # running the per-element '%d-%b-%y' parser
+    date_parts = df['Date'].str.split('-', expand=True)
+    df['Date'] = pd.to_datetime(pd.DataFrame({
+        'year': 2000 + pd.to_numeric(date_parts[2], errors='coerce'),
+        'month': date_parts[1].map(MONTH_ABBR),
+        'day': pd.to_numeric(date_parts[0], errors='coerce')
+    }), errors='coerce')
     df = df.dropna(subset=['Date'])
-    df['Month'] = df['Date'].dt.month_name()
-    df['Year'] = df['Date'].dt.year
+    # Integer keys keep the monthly groupby off the string-hashing path; month
+    # names are attached to the aggregated result only
+    df['Month'] = df['Date'].dt.month.astype('int8[pyarrow]')
+    df['Year'] = df['Date'].dt.year.astype('int16[pyarrow]')
     df['Revenue per Box'] = df['Amount'] / df['Boxes Shipped']
-    return df
+    df['Country'] = df['Country'].astype('category')
+    df['Product'] = df['Product'].astype('category')
+    # Keep every column Arrow-backed so scans and reductions run on contiguous
+    # Arrow buffers and Arrow compute kernels
+    df = df.convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
+    # Monthly cube over the four chart dimensions; everything that does not
+    # need day-level dates is derived from this instead of the raw rows
+    cube = df.groupby(['Year', 'Month', 'Country', 'Product'], observed=True, sort=False)[['Amount', 'Boxes Shipped']].sum().reset_index()
+    return df, cube
+
+df, cube = load_data()
+
+# Cached Aggregations
+# Every function below is keyed on the sorted tuples of selected countries and
+# products, so revisiting a filter combination skips the pandas work entirely.
+def selection_mask(frame, countries, products):
+    # Compare integer category codes rather than hashing every string
+    country_codes = frame['Country'].cat.categories.get_indexer(list(countries))
+    product_codes = frame['Product'].cat.categories.get_indexer(list(products))
+    return (
+        np.isin(frame['Country'].cat.codes.to_numpy(), country_codes) &
+        np.isin(frame['Product'].cat.codes.to_numpy(), product_codes)
+    )
+
+@st.cache_data
+def get_filtered(countries, products):
+    df, _ = load_data()
+    return df[selection_mask(df, countries, products)]
+
+@st.cache_data
+def get_filtered_cube(countries, products):
+    _, cube = load_data()
+    return cube[selection_mask(cube, countries, products)]
+
+# Sum values per integer key in one bincount pass and pick the k largest groups
+# with argpartition, without building and sorting a full grouped Series
+def top_k_by_group(keys, values, n_groups, k):
+    sums = np.bincount(keys, weights=values, minlength=n_groups)
+    present = np.flatnonzero(np.bincount(keys, minlength=n_groups))
+    if len(present) > k:
+        present = present[np.argpartition(-sums[present], k - 1)[:k]]
+    top = present[np.lexsort((present, -sums[present]))]
+    return top, sums[top]
+
+# Shared base aggregations: each scans the filtered rows (or the much smaller
+# filtered cube) once and the chart-level helpers below derive their views
+# from these instead of re-grouping.
+@st.cache_data
+def get_date_sales(countries, products):
+    return get_filtered(countries, products).groupby('Date', sort=True)['Amount'].sum()
+
+@st.cache_data
+def get_country_product_sales(countries, products):
+    return get_filtered_cube(countries, products).groupby(['Country', 'Product'], observed=True, sort=False)['Amount'].sum()
+
+@st.cache_data
+def get_year_product_totals(countries, products):
+    return get_filtered_cube(countries, products).groupby(['Year', 'Product'], observed=True).agg({
+        'Amount': 'sum',
+        'Boxes Shipped': 'sum'
+    })
+
+@st.cache_data
+def get_monthly_sales(countries, products):
+    monthly_sales = get_filtered_cube(countries, products).groupby(['Year', 'Month'])['Amount'].sum().reset_index()
+    monthly_sales['MonthName'] = monthly_sales['Month'].map(dict(enumerate(month_order, start=1)))
+    return monthly_sales
+
+@st.cache_data
+def get_daily_sales(countries, products):
+    return get_date_sales(countries, products).reset_index()
+
+@st.cache_data
+def get_top_combos(countries, products):
+    filtered_cube = get_filtered_cube(countries, products)
+    country_cat = filtered_cube['Country'].cat
+    product_cat = filtered_cube['Product'].cat
+    n_products = len(product_cat.categories)
+    keys = country_cat.codes.to_numpy(np.int64) * n_products + product_cat.codes.to_numpy(np.int64)
+    top, sums = top_k_by_group(
+        keys, filtered_cube['Amount'].to_numpy(), len(country_cat.categories) * n_products, 15
+    )
+    return pd.DataFrame({
+        'Country': pd.Categorical.from_codes(top // n_products, dtype=filtered_cube['Country'].dtype),
+        'Product': pd.Categorical.from_codes(top % n_products, dtype=filtered_cube['Product'].dtype),
+        'Amount': sums
+    })
+
+@st.cache_data
+def get_country_sales(countries, products):
+    return get_country_product_sales(countries, products).groupby(level='Country', observed=True, sort=False).sum().reset_index()
+
+@st.cache_data
+def get_top_products(countries, products):
+    return get_product_sales(countries, products).reset_index()
+
+@st.cache_data
+def get_weekday_sales(countries, products):
+    return get_date_sales(countries, products).reset_index().assign(
+        Weekday=lambda d: d['Date'].dt.day_name()
+    )
+
+@st.cache_data
+def get_top_days(countries, products):
+    filtered_df = get_filtered(countries, products)
+    if filtered_df.empty:
+        return pd.DataFrame({'Date': pd.Series(dtype='datetime64[ns]'), 'Amount': pd.Series(dtype=float)})
+    days = filtered_df['Date'].to_numpy().astype('datetime64[D]').astype(np.int64)
+    first_day = days.min()
+    top, sums = top_k_by_group(
+        days - first_day, filtered_df['Amount'].to_numpy(), days.max() - first_day + 1, 10
+    )
+    return pd.DataFrame({
+        'Date': pd.to_datetime((top + first_day).astype('datetime64[D]')),
+        'Amount': sums
+    })
 
-df = load_data()
+@st.cache_data
+def get_growth(countries, products):
+    growth_df = get_year_product_totals(countries, products).reset_index()
+    growth_df['Revenue per Box'] = growth_df['Amount'] / growth_df['Boxes Shipped']
+    return growth_df
+
+@st.cache_data
+def get_ratio(countries, products):
+    ratio_df = get_year_product_totals(countries, products).groupby(level='Product', observed=True, sort=False).sum().reset_index()
+    ratio_df['Ratio'] = ratio_df['Amount'] / ratio_df['Boxes Shipped']
+    return ratio_df
+
+@st.cache_data
+def get_product_sales(countries, products):
+    return get_country_product_sales(countries, products).groupby(level='Product', observed=True, sort=False).sum().nlargest(10)
+
+SUNBURST_TOP_PRODUCTS = 5
+
+@st.cache_data
+def get_sunburst_data(countries, products):
+    # Keep the top products per country and fold the long tail into "Other" so
+    # the sunburst does not draw wedges too small to see
+    sunburst_data = get_country_product_sales(countries, products).reset_index()
+    sunburst_data = sunburst_data.sort_values('Amount', ascending=False)
+    rank = sunburst_data.groupby('Country', observed=True, sort=False).cumcount()
+    sunburst_data['Product'] = sunburst_data['Product'].astype(str).where(rank < SUNBURST_TOP_PRODUCTS, 'Other')
+    return sunburst_data.groupby(['Country', 'Product'], observed=True, sort=False)['Amount'].sum().reset_index()
 
 # Dashboard Header
 st.title(" Chocolate Sales Analytics")
@@ -60,49 +258,55 @@ with st.sidebar:
     countries = st.multiselect(
         "Countries",
         options=sorted(df['Country'].unique()),
-        default=df['Country'].unique()
+        default=list(df['Country'].unique())
     )
     products = st.multiselect(
         "Products",
         options=sorted(df['Product'].unique()),
-        default=df['Product'].unique()
+        default=list(df['Product'].unique())
     )
 
 # Apply filters
-filtered_df = df[
-    (df['Country'].isin(countries)) & 
-    (df['Product'].isin(products))
+country_key = tuple(sorted(countries))
+product_key = tuple(sorted(products))
+filtered_df = get_filtered(country_key, product_key)
+
+# Warm the independent aggregations concurrently; pandas groupby and the numpy
+# kernels release the GIL, and the charts below then read from the cache
+AGGREGATIONS = [
+    get_date_sales,
+    get_country_product_sales,
+    get_year_product_totals,
+    get_monthly_sales,
+    get_top_combos,
+    get_top_days,
 ]
+script_ctx = get_script_run_ctx()
+with ThreadPoolExecutor(
+    max_workers=4,
+    # st.cache_data needs the session's script context in worker threads
+    initializer=lambda: add_script_run_ctx(threading.current_thread(), script_ctx)
+) as executor:
+    for future in [executor.submit(fn, country_key, product_key) for fn in AGGREGATIONS]:
+        future.result()
+
+# Monthly and per-country totals each feed two charts; fetch them once and hand
+# the same frame to both builders (underscore args are left out of the cache key)
+monthly_sales = get_monthly_sales(country_key, product_key)
+country_sales = get_country_sales(country_key, product_key)
+
+# Each chart below is built by an st.cache_data function keyed on the same
+# filter tuples, so a repeated selection reuses the finished Plotly figure.
 
 # Key Metrics
 st.markdown("### Key Metrics")
 col1, col2, col3 = st.columns(3)
-with col1:
-    total_sales = filtered_df['Amount'].sum()
-    st.markdown(f"""
-    <div class="card">
-        <div>Total Sales</div>
-        <div class="metric-value">${total_sales:,.2f}</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-with col2:
-    total_boxes = filtered_df['Boxes Shipped'].sum()
-    st.markdown(f"""
-    <div class="card">
-        <div>Total Boxes Shipped</div>
-        <div class="metric-value">{total_boxes:,}</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-with col3:
-    avg_revenue = total_sales / total_boxes if total_boxes > 0 else 0
-    st.markdown(f"""
-    <div class="card">
-        <div>Revenue per Box</div>
-        <div class="metric-value">${avg_revenue:,.2f}</div>
-    </div>
-    """, unsafe_allow_html=True)
+total_sales = filtered_df['Amount'].sum()
+total_boxes = filtered_df['Boxes Shipped'].sum()
+avg_revenue = total_sales / total_boxes if total_boxes > 0 else 0
+col1.metric("Total Sales", f"${total_sales:,.2f}")
+col2.metric("Total Boxes Shipped", f"{total_boxes:,}")
+col3.metric("Revenue per Box", f"${avg_revenue:,.2f}")
 
 
 
@@ -110,34 +314,40 @@ with col3:
 
 st.markdown('<div class="section-header"> Monthly Sales Comparison</div>', unsafe_allow_html=True)
 
-monthly_sales = filtered_df.groupby(['Year', 'Month'])['Amount'].sum().reset_index()
-month_order = ['January', 'February', 'March', 'April', 'May', 'June', 
-               'July', 'August', 'September', 'October', 'November', 'December']
+@st.cache_data
+def build_monthly_bar(countries, products, _monthly_sales):
+    fig = px.bar(
+        _monthly_sales,
+        x='MonthName',
+        y='Amount',
+        color='Year',
+        barmode='group',
+        category_orders={'MonthName': month_order},
+        labels={'Amount': 'Sales ($)', 'MonthName': 'Month'}
+    )
+    return fig
 
-fig = px.bar(
-    monthly_sales,
-    x='Month',
-    y='Amount',
-    color='Year',
-    barmode='group',
-    category_orders={'Month': month_order},
-    labels={'Amount': 'Sales ($)'}
-)
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(build_monthly_bar(country_key, product_key, monthly_sales), use_container_width=True)
 
 
 
 # 3. Daily Sales Trend Line Chart 📈
 st.markdown('<div class="section-header"> Daily Sales Trend</div>', unsafe_allow_html=True)
 
-daily_sales = filtered_df.groupby('Date')['Amount'].sum().reset_index()
-fig = px.line(
-    daily_sales,
-    x='Date',
-    y='Amount',
-    labels={'Amount': 'Sales ($)'}
-)
-st.plotly_chart(fig, use_container_width=True)
+@st.cache_data
+def build_daily_trend(countries, products):
+    daily_sales = get_daily_sales(countries, products)
+    # WebGL trace keeps the browser cost flat as the number of days grows
+    fig = go.Figure(go.Scattergl(
+        x=daily_sales['Date'],
+        y=daily_sales['Amount'],
+        mode='lines',
+        hovertemplate='Date=%{x}<br>Sales ($)=%{y}<extra></extra>'
+    ))
+    fig.update_layout(xaxis_title='Date', yaxis_title='Sales ($)')
+    return fig
+
+st.plotly_chart(build_daily_trend(country_key, product_key), use_container_width=True)
 
 
 
@@ -148,16 +358,20 @@ st.plotly_chart(fig, use_container_width=True)
 
 st.markdown('<div class="section-header">Top Products by Country</div>', unsafe_allow_html=True)
 
-top_combos = filtered_df.groupby(['Country', 'Product'])['Amount'].sum().nlargest(15).reset_index()
-fig = px.bar(
-    top_combos,
-    x='Amount',
-    y='Country',
-    color='Product',
-    orientation='h',
-    labels={'Amount': 'Sales ($)'}
-)
-st.plotly_chart(fig, use_container_width=True)
+@st.cache_data
+def build_top_combos(countries, products):
+    top_combos = get_top_combos(countries, products)
+    fig = px.bar(
+        top_combos,
+        x='Amount',
+        y='Country',
+        color='Product',
+        orientation='h',
+        labels={'Amount': 'Sales ($)'}
+    )
+    return fig
+
+st.plotly_chart(build_top_combos(country_key, product_key), use_container_width=True)
 
 
 
@@ -166,25 +380,23 @@ st.plotly_chart(fig, use_container_width=True)
 # sales by country
 st.markdown('<div class="section-header">Sales by Country (Map)</div>', unsafe_allow_html=True)
 
-# Convert country names to ISO codes
-def country_to_iso(country_name):
-    try:
-        return pycountry.countries.search_fuzzy(country_name)[0].alpha_3
-    except:
-        return None
-
-country_sales = filtered_df.groupby('Country')['Amount'].sum().reset_index()
-country_sales['ISO'] = country_sales['Country'].apply(country_to_iso)
+@st.cache_data
+def build_country_map(countries, products, _country_sales):
+    iso_map = get_iso_map(tuple(df['Country'].cat.categories))
+    fig = px.choropleth(
+        _country_sales.assign(ISO=_country_sales['Country'].map(iso_map)),
+        locations="ISO",
+        color="Amount",
+        hover_name="Country",
+        color_continuous_scale=px.colors.sequential.Plasma,
+        labels={'Amount': 'Total Sales ($)'}
+    )
+    return fig
 
-fig = px.choropleth(
-    country_sales,
-    locations="ISO",
-    color="Amount",
-    hover_name="Country",
-    color_continuous_scale=px.colors.sequential.Plasma,
-    labels={'Amount': 'Total Sales ($)'}
-)
-st.plotly_chart(fig, use_container_width=True)
+# Collapsed content still runs on every rerun, so a toggle (not an expander)
+# is what keeps ISO resolution and the choropleth off the default render
+if st.toggle("Show world map", value=False):
+    st.plotly_chart(build_country_map(country_key, product_key, country_sales), use_container_width=True)
 
 
 
@@ -193,16 +405,21 @@ st.plotly_chart(fig, use_container_width=True)
 
 # 5. Top Products Bar Chart
 st.markdown('<div class="section-header"> Top Performing Products</div>', unsafe_allow_html=True)
-top_products = filtered_df.groupby('Product')['Amount'].sum().nlargest(10).reset_index()
-fig = px.bar(
-    top_products,
-    x='Amount',
-    y='Product',
-    orientation='h',
-    color='Amount',
-    labels={'Amount': 'Total Sales ($)', 'Product': ''}
-)
-st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_data
+def build_top_products(countries, products):
+    top_products = get_top_products(countries, products)
+    fig = px.bar(
+        top_products,
+        x='Amount',
+        y='Product',
+        orientation='h',
+        color='Amount',
+        labels={'Amount': 'Total Sales ($)', 'Product': ''}
+    )
+    return fig
+
+st.plotly_chart(build_top_products(country_key, product_key), use_container_width=True)
 
 
 
@@ -212,17 +429,21 @@ st.plotly_chart(fig, use_container_width=True)
 
 # 1. Sales Trend by Weekday
 st.markdown('<div class="section-header"> Sales by Day of Week</div>', unsafe_allow_html=True)
-weekday_sales = filtered_df.groupby('Date')['Amount'].sum().reset_index()
-weekday_sales['Weekday'] = weekday_sales['Date'].dt.day_name()
-weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-fig = px.box(
-    weekday_sales,
-    x='Weekday',
-    y='Amount',
-    category_orders={'Weekday': weekday_order},
-    labels={'Amount': 'Daily Sales ($)', 'Weekday': ''}
-)
-st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_data
+def build_weekday_box(countries, products):
+    weekday_sales = get_weekday_sales(countries, products)
+    weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    fig = px.box(
+        weekday_sales,
+        x='Weekday',
+        y='Amount',
+        category_orders={'Weekday': weekday_order},
+        labels={'Amount': 'Daily Sales ($)', 'Weekday': ''}
+    )
+    return fig
+
+st.plotly_chart(build_weekday_box(country_key, product_key), use_container_width=True)
 
 
 
@@ -233,17 +454,21 @@ st.plotly_chart(fig, use_container_width=True)
 # top 10 sales of the day
 st.markdown('<div class="section-header"> Top 10 Sales Days</div>', unsafe_allow_html=True)
 
-top_days = filtered_df.groupby('Date')['Amount'].sum().nlargest(10).reset_index()
-top_days['FormattedDate'] = top_days['Date'].dt.strftime('%b %d, %Y')
+@st.cache_data
+def build_top_days(countries, products):
+    top_days = get_top_days(countries, products)
+    top_days['FormattedDate'] = top_days['Date'].dt.strftime('%b %d, %Y')
+
+    fig = px.bar(
+        top_days,
+        x='FormattedDate',
+        y='Amount',
+        labels={'Amount': 'Sales ($)', 'FormattedDate': 'Date'}
+    )
+    fig.update_layout(xaxis={'categoryorder':'total descending'})
+    return fig
 
-fig = px.bar(
-    top_days,
-    x='FormattedDate',
-    y='Amount',
-    labels={'Amount': 'Sales ($)', 'FormattedDate': 'Date'}
-)
-fig.update_layout(xaxis={'categoryorder':'total descending'})
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(build_top_days(country_key, product_key), use_container_width=True)
 
 
 
@@ -251,53 +476,114 @@ st.plotly_chart(fig, use_container_width=True)
 
 
 # Prepare animated data
-growth_df = filtered_df.groupby(['Year', 'Product']).agg({
-    'Amount': 'sum',
-    'Boxes Shipped': 'sum'
-}).reset_index()
-growth_df['Revenue per Box'] = growth_df['Amount'] / growth_df['Boxes Shipped']
-
-fig = px.scatter(
-    growth_df,
-    x="Boxes Shipped",
-    y="Amount",
-    size="Revenue per Box",
-    color="Product",
-    animation_frame="Year",
-    hover_name="Product",
-    size_max=45,
-    range_x=[growth_df['Boxes Shipped'].min()*0.9, growth_df['Boxes Shipped'].max()*1.1],
-    range_y=[growth_df['Amount'].min()*0.9, growth_df['Amount'].max()*1.1],
-    labels={'Amount': 'Total Revenue ($)', 'Boxes Shipped': 'Boxes Shipped'}
-)
-st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_data
+def build_growth_scatter(countries, products):
+    growth_df = get_growth(countries, products)
+    palette = px.colors.qualitative.Plotly
+    product_names = list(growth_df['Product'].unique())
+    product_color_map = {p: palette[i % len(palette)] for i, p in enumerate(product_names)}
+    # Same area scaling px.scatter applies for size_max=45
+    size_ref = growth_df['Revenue per Box'].max() / 45 ** 2
+
+    # One WebGL trace per product in every frame, so the animation only swaps
+    # data instead of rebuilding the product x year trace set through px
+    def year_traces(year_df):
+        by_product = {p: sub for p, sub in year_df.groupby('Product', observed=True, sort=False)}
+        traces = []
+        for p in product_names:
+            sub = by_product.get(p, year_df.iloc[:0])
+            traces.append(go.Scattergl(
+                x=sub['Boxes Shipped'],
+                y=sub['Amount'],
+                mode='markers',
+                name=p,
+                legendgroup=p,
+                hovertext=sub['Product'],
+                hovertemplate='<b>%{hovertext}</b><br><br>Boxes Shipped=%{x}<br>'
+                              'Total Revenue ($)=%{y}<br>Revenue per Box=%{marker.size}<extra></extra>',
+                marker=dict(
+                    size=sub['Revenue per Box'],
+                    sizemode='area',
+                    sizeref=size_ref,
+                    color=product_color_map[p]
+                )
+            ))
+        return traces
+
+    frames = [
+        go.Frame(data=year_traces(year_df), name=str(year))
+        for year, year_df in growth_df.groupby('Year')
+    ]
+    def frame_args(duration):
+        return {
+            'frame': {'duration': duration, 'redraw': True},
+            'mode': 'immediate',
+            'fromcurrent': True,
+            'transition': {'duration': 0}
+        }
+
+    fig = go.Figure(data=frames[0].data if frames else [], frames=frames)
+    fig.update_layout(
+        xaxis={'title': 'Boxes Shipped',
+               'range': [growth_df['Boxes Shipped'].min()*0.9, growth_df['Boxes Shipped'].max()*1.1]},
+        yaxis={'title': 'Total Revenue ($)',
+               'range': [growth_df['Amount'].min()*0.9, growth_df['Amount'].max()*1.1]},
+        legend={'title': 'Product'},
+        updatemenus=[{
+            'type': 'buttons',
+            'direction': 'left',
+            'x': 0.1, 'y': 0, 'xanchor': 'right', 'yanchor': 'top',
+            'pad': {'r': 10, 't': 70},
+            'showactive': False,
+            'buttons': [
+                {'label': '&#9654;', 'method': 'animate', 'args': [None, frame_args(500)]},
+                {'label': '&#9724;', 'method': 'animate', 'args': [[None], frame_args(0)]}
+            ]
+        }],
+        sliders=[{
+            'active': 0,
+            'currentvalue': {'prefix': 'Year='},
+            'x': 0.1, 'y': 0, 'len': 0.9, 'xanchor': 'left', 'yanchor': 'top',
+            'pad': {'b': 10, 't': 60},
+            'steps': [
+                {'label': f.name, 'method': 'animate', 'args': [[f.name], frame_args(0)]}
+                for f in frames
+            ]
+        }]
+    )
+    return fig
+
+st.plotly_chart(build_growth_scatter(country_key, product_key), use_container_width=True)
 
 
 
 
 # revenune vs box
 st.markdown('<div class="section-header"> Volume vs Revenue</div>', unsafe_allow_html=True)
-ratio_df = filtered_df.groupby('Product').agg({
-    'Amount': 'sum',
-    'Boxes Shipped': 'sum'
-}).reset_index()
-ratio_df['Ratio'] = ratio_df['Amount'] / ratio_df['Boxes Shipped']
-
-fig = px.scatter(
-    ratio_df,
-    x='Boxes Shipped',
-    y='Amount',
-    size='Ratio',
-    color='Ratio',
-    hover_name='Product',
-    log_x=True,
-    labels={
-        'Amount': 'Total Revenue ($)',
-        'Boxes Shipped': 'Boxes Shipped (log scale)',
-        'Ratio': 'Revenue/Box'
-    }
-)
-st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_data
+def build_ratio_scatter(countries, products):
+    ratio_df = get_ratio(countries, products)
+
+    fig = px.scatter(
+        ratio_df,
+        x='Boxes Shipped',
+        y='Amount',
+        size='Ratio',
+        color='Ratio',
+        hover_name='Product',
+        log_x=True,
+        render_mode='webgl',
+        labels={
+            'Amount': 'Total Revenue ($)',
+            'Boxes Shipped': 'Boxes Shipped (log scale)',
+            'Ratio': 'Revenue/Box'
+        }
+    )
+    return fig
+
+st.plotly_chart(build_ratio_scatter(country_key, product_key), use_container_width=True)
 
 
 
@@ -306,16 +592,20 @@ st.plotly_chart(fig, use_container_width=True)
 
 # 4. Monthly Sales Comparison
 st.markdown('<div class="section-header">Monthly Sales Trends</div>', unsafe_allow_html=True)
-monthly_sales = filtered_df.groupby(['Year', 'Month'])['Amount'].sum().reset_index()
-fig = px.line(
-    monthly_sales,
-    x='Month',
-    y='Amount',
-    color='Year',
-    markers=True,
-    labels={'Amount': 'Sales ($)', 'Month': ''}
-)
-st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_data
+def build_monthly_trend(countries, products, _monthly_sales):
+    fig = px.line(
+        _monthly_sales,
+        x='MonthName',
+        y='Amount',
+        color='Year',
+        markers=True,
+        labels={'Amount': 'Sales ($)', 'MonthName': ''}
+    )
+    return fig
+
+st.plotly_chart(build_monthly_trend(country_key, product_key, monthly_sales), use_container_width=True)
 
 
 
@@ -338,31 +628,39 @@ st.plotly_chart(fig, use_container_width=True)
 
 st.markdown('<div class="section-header"> Product Sales Composition</div>', unsafe_allow_html=True)
 
-product_sales = filtered_df.groupby('Product')['Amount'].sum().nlargest(10)
-fig = px.pie(
-    product_sales,
-    values=product_sales.values,
-    names=product_sales.index,
-    hole=0.3
-)
-st.plotly_chart(fig, use_container_width=True)
+@st.cache_data
+def build_product_pie(countries, products):
+    product_sales = get_product_sales(countries, products)
+    fig = px.pie(
+        product_sales,
+        values=product_sales.values,
+        names=product_sales.index,
+        hole=0.3
+    )
+    return fig
+
+st.plotly_chart(build_product_pie(country_key, product_key), use_container_width=True)
 
 
 
 
 st.markdown('<div class="section-header"> Sales Hierarchy</div>', unsafe_allow_html=True)
 
-sunburst_data = filtered_df.groupby(['Country', 'Product'])['Amount'].sum().reset_index()
+@st.cache_data
+def build_sunburst(countries, products):
+    sunburst_data = get_sunburst_data(countries, products)
+
+    fig = px.sunburst(
+        sunburst_data,
+        path=['Country', 'Product'],
+        values='Amount',
+        color='Amount',
+        color_continuous_scale='RdBu',
+        hover_data=['Amount']
+    )
+    return fig
 
-fig = px.sunburst(
-    sunburst_data,
-    path=['Country', 'Product'],
-    values='Amount',
-    color='Amount',
-    color_continuous_scale='RdBu',
-    hover_data=['Amount']
-)
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(build_sunburst(country_key, product_key), use_container_width=True)
 
 
 
@@ -370,34 +668,49 @@ st.plotly_chart(fig, use_container_width=True)
 # Country Performance
 st.markdown('<div class="section-header">Country Performance</div>', unsafe_allow_html=True)
 
-country_sales = filtered_df.groupby('Country')['Amount'].sum()
-top_country = country_sales.idxmax()
-max_sales = country_sales.max()
-total_sales = country_sales.sum()
-
-fig = go.Figure(go.Indicator(
-    mode = "gauge+number",
-    value = max_sales,
-    title = f"Top Country: {top_country}",
-    gauge = {
-        'axis': {'range': [0, total_sales*0.5]},
-        'steps': [
-            {'range': [0, total_sales*0.25], 'color': "lightgray"},
-            {'range': [total_sales*0.25, total_sales*0.5], 'color': "gray"}],
-        'threshold': {
-            'line': {'color': "red", 'width': 4},
-            'thickness': 0.75,
-            'value': max_sales}
-    }
-))
-st.plotly_chart(fig, use_container_width=True)
+@st.cache_data
+def build_country_gauge(countries, products, _country_sales):
+    sales_by_country = _country_sales.set_index('Country')['Amount']
+    top_country = sales_by_country.idxmax()
+    max_sales = sales_by_country.max()
+    total_sales = sales_by_country.sum()
+
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = max_sales,
+        title = f"Top Country: {top_country}",
+        gauge = {
+            'axis': {'range': [0, total_sales*0.5]},
+            'steps': [
+                {'range': [0, total_sales*0.25], 'color': "lightgray"},
+                {'range': [total_sales*0.25, total_sales*0.5], 'color': "gray"}],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': max_sales}
+        }
+    ))
+    return fig
+
+st.plotly_chart(build_country_gauge(country_key, product_key, country_sales), use_container_width=True)
 
 
 
 # Raw Data
+# Serialised once per selection with Arrow's multithreaded CSV writer
+@st.cache_data
+def get_csv_bytes(countries, products):
+    table = pa.Table.from_pandas(get_filtered(countries, products), preserve_index=False)
+    table = table.set_column(
+        table.schema.get_field_index('Date'), 'Date', table['Date'].cast(pa.date32())
+    )
+    sink = io.BytesIO()
+    pacsv.write_csv(table, sink)
+    return sink.getvalue()
+
 with st.expander("View Raw Data"):
     st.dataframe(filtered_df)
-    csv = filtered_df.to_csv(index=False).encode('utf-8')
+    csv = get_csv_bytes(country_key, product_key)
     st.download_button(
         label="Download Data",
         data=csv,